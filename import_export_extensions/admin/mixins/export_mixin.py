@@ -1,3 +1,4 @@
+import functools
 import typing
 
 from django.core.exceptions import PermissionDenied
@@ -18,6 +19,13 @@ from import_export.forms import ExportForm
 from ... import models
 from . import base_mixin, types
 
+# Map of admin search field prefix to lookup used for searching
+_SEARCH_PREFIX_LOOKUP: dict[str, str] = {
+    "^": "istartswith",
+    "=": "iexact",
+    "@": "search",
+}
+
 
 class CeleryExportAdminMixin(
     import_export_mixins.BaseExportMixin,
@@ -61,14 +69,52 @@ class CeleryExportAdminMixin(
     )
 
     # Statuses that should be displayed on 'results' page
-    export_results_statuses = models.ExportJob.export_finished_statuses
+    export_results_statuses: frozenset[str] = (
+        models.ExportJob.export_finished_statuses
+    )
 
-    # Copy methods of mixin from original package to reuse it here
-    has_export_permission = (
-        import_export_admin.ExportMixin.has_export_permission
+    # ExportJob fields loaded by status view, which is polled during export
+    export_status_job_fields = (
+        "id",
+        "export_status",
     )
+
+    # Name of request attribute to cache export permission checks
+    export_permission_cache_attr = "_iee_has_export_perm"
+
+    # Copy methods of mixin from original package to reuse it here
     get_export_form_class = import_export_admin.ExportMixin.get_export_form_class  # noqa
 
+    def has_export_permission(self, request: WSGIRequest) -> bool:
+        """Check export permission once per request.
+
+        Permission is checked by every export view and changelist, so result
+        is cached on request object. Cache is keyed by model, because single
+        request may pass through several admins.
+
+        """
+        cache = getattr(request, self.export_permission_cache_attr, None)
+        if cache is None:
+            cache = {}
+            setattr(request, self.export_permission_cache_attr, cache)
+        key = (self.opts.app_label, self.opts.model_name)
+        if key not in cache:
+            cache[key] = import_export_admin.ExportMixin.has_export_permission(
+                self,
+                request,
+            )
+        return cache[key]
+
+    @functools.cached_property
+    def _cached_export_formats(self) -> tuple[types.FormatType, ...]:
+        """Get export formats once for admin instance.
+
+        Formats don't depend on request, so there is no need to check which
+        of them can export on every request.
+
+        """
+        return tuple(self.get_export_formats())
+
     def get_export_context_data(self, **kwargs):
         """Get context data for export."""
         return self.get_context_data(**kwargs)
@@ -85,29 +131,24 @@ class CeleryExportAdminMixin(
 
         """
         urls = super().get_urls()
+        app_model_name = self.model_info.app_model_name
         export_urls = [
             re_path(
                 r"^celery-export/$",
                 self.admin_site.admin_view(self.celery_export_action),
-                name=f"{self.model_info.app_model_name}_export",
+                name=f"{app_model_name}_export",
             ),
             re_path(
                 r"^celery-export/(?P<job_id>\d+)/$",
                 self.admin_site.admin_view(self.export_job_status_view),
-                name=(
-                    f"{self.model_info.app_model_name}"
-                    f"_export_job_status"
-                ),
+                name=f"{app_model_name}_export_job_status",
             ),
             re_path(
                 r"^celery-export/(?P<job_id>\d+)/results/$",
                 self.admin_site.admin_view(
                     self.export_job_results_view,
                 ),
-                name=(
-                    f"{self.model_info.app_model_name}"
-                    f"_export_job_results"
-                ),
+                name=f"{app_model_name}_export_job_results",
             ),
         ]
         return export_urls + urls
@@ -122,7 +163,7 @@ class CeleryExportAdminMixin(
         if not self.has_export_permission(request):
             raise PermissionDenied
 
-        formats = self.get_export_formats()
+        formats = self._cached_export_formats
         form_type = self.get_export_form_class()
         form = form_type(
             formats=formats,
@@ -183,7 +224,7 @@ class CeleryExportAdminMixin(
         if not self.has_export_permission(request):
             raise PermissionDenied
 
-        job = self.get_export_job(request=request, job_id=job_id)
+        job = self._get_export_status_job(job_id=job_id)
         if job.export_status in self.export_results_statuses:
             return self._redirect_to_export_results_page(
                 request=request,
@@ -273,6 +314,18 @@ class CeleryExportAdminMixin(
         """
         return get_object_or_404(models.ExportJob, id=job_id)
 
+    def _get_export_status_job(self, job_id: int) -> models.ExportJob:
+        """Get ExportJob instance with fields required by status view.
+
+        Raises
+            Http404
+
+        """
+        return get_object_or_404(
+            models.ExportJob.objects.only(*self.export_status_job_fields),
+            id=job_id,
+        )
+
     def get_resource_kwargs(self, request, *args, **kwargs):
         """Return filter kwargs for resource queryset."""
         resource_kwargs = super().get_resource_kwargs(request, *args, **kwargs)
@@ -291,17 +344,22 @@ class CeleryExportAdminMixin(
             request=request,
             value=query_params.pop("q", []),
         )
-        admin_filter = {}
+        # Only field names can match query params, so other filters
+        # (list filter classes, tuples with field and filter) are skipped
+        list_filter = {
+            item
+            for item in self.get_list_filter(request)
+            if isinstance(item, str)
+        }
         admin_filter = {
             key: value
             for key in query_params
             for value in query_params[key]
-            if key in self.get_list_filter(request)
+            if key in list_filter
         }
         admin_filter["search"] = search_kwargs
         return admin_filter
 
-
     def _export_get_search_filter(
         self,
         request: WSGIRequest,
@@ -318,14 +376,14 @@ class CeleryExportAdminMixin(
             else ""
         )
         search_kwargs = {}
-        used_fields = []
+        used_fields: set[str] = set()
         for search_field in self.get_search_fields(request):
             lookup_field, model_field = self._export_construct_search(
                 search_field,
             )
             if model_field in used_fields:
                 continue
-            used_fields.append(model_field)
+            used_fields.add(model_field)
             search_kwargs[lookup_field] = extracted_value
         return search_kwargs
 
@@ -338,18 +396,11 @@ class CeleryExportAdminMixin(
         Inspired by https://github.com/django/django/blob/d6925f0d6beb3c08ae24bdb8fd83ddb13d1756e4/django/contrib/admin/options.py#L1137
 
         """
-        match (search_type := field_name[0]):
-            case "^":
-                lookup = "istartswith"
-            case "=":
-                lookup = "iexact"
-            case "@":
-                lookup = "search"
-            case _:
-                search_type = ""
-                lookup = "icontains"
-        field_name = field_name.removeprefix(search_type)
-        return f"{field_name}__{lookup}", field_name
+        lookup = _SEARCH_PREFIX_LOOKUP.get(field_name[:1])
+        if lookup:
+            field_name = field_name[1:]
+            return f"{field_name}__{lookup}", field_name
+        return f"{field_name}__icontains", field_name
 
     def _redirect_to_export_status_page(
         self,
@@ -357,13 +408,12 @@ class CeleryExportAdminMixin(
         job: models.ExportJob,
     ) -> HttpResponse:
         """Shortcut for redirecting to job's status page."""
+        app_model_name = self.model_info.app_model_name
         url_name = (
-            f"{self.admin_site.name}:{self.model_info.app_model_name}_export_job_status"
+            f"{self.admin_site.name}:{app_model_name}_export_job_status"
         )
         url = reverse(url_name, kwargs=dict(job_id=job.id))
-        query = request.GET.urlencode()
-        url = f"{url}?{query}" if query else url
-        return HttpResponseRedirect(redirect_to=url)
+        return self._redirect_with_query_params(request=request, url=url)
 
     def _redirect_to_export_results_page(
         self,
@@ -371,13 +421,23 @@ class CeleryExportAdminMixin(
         job: models.ExportJob,
     ) -> HttpResponse:
         """Shortcut for redirecting to job's results page."""
+        app_model_name = self.model_info.app_model_name
         url_name = (
-            f"{self.admin_site.name}:{self.model_info.app_model_name}_export_job_results"
+            f"{self.admin_site.name}:{app_model_name}_export_job_results"
         )
         url = reverse(url_name, kwargs=dict(job_id=job.id))
-        query = request.GET.urlencode()
-        url = f"{url}?{query}" if query else url
-        return HttpResponseRedirect(redirect_to=url)
+        return self._redirect_with_query_params(request=request, url=url)
+
+    def _redirect_with_query_params(
+        self,
+        request: WSGIRequest,
+        url: str,
+    ) -> HttpResponseRedirect:
+        """Redirect to url keeping query params of current request."""
+        if not request.GET:
+            return HttpResponseRedirect(redirect_to=url)
+        query = request.GET.urlencode(safe="/,")
+        return HttpResponseRedirect(redirect_to=f"{url}?{query}")
 
     def changelist_view(
         self,
@@ -4,8 +4,13 @@ import http
 from django.contrib import admin, messages
 from django.core.handlers.wsgi import WSGIRequest
 from django.db.models import QuerySet
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.urls import re_path
+from django.utils.cache import (
+    add_never_cache_headers,
+    get_conditional_response,
+    patch_cache_control,
+)
 from django.utils.translation import gettext_lazy as _
 
 from ... import models
@@ -36,6 +41,12 @@ class ExportJobAdmin(
         "_model",
     )
     export_job_model = models.ExportJob
+    # Fields required to get export job progress
+    export_job_progress_fields = (
+        "id",
+        "export_status",
+        "export_task_id",
+    )
     list_filter = ("export_status",)
     list_select_related = ("created_by",)
     actions = (
@@ -72,7 +83,12 @@ class ExportJobAdmin(
         export_urls = [
             re_path(
                 route=r"^celery-export/(?P<job_id>\d+)/progress/$",
-                view=self.admin_site.admin_view(self.export_job_progress_view),
+                # Progress view sets cache headers itself, so polling client
+                # can revalidate response with `ETag`
+                view=self.admin_site.admin_view(
+                    self.export_job_progress_view,
+                    cacheable=True,
+                ),
                 name="export_job_progress",
             ),
         ]
@@ -89,24 +105,29 @@ class ExportJobAdmin(
         If current status is exporting, view also returns job state
         and percent of completed work.
 
+        Response contains `ETag` header built from its data, so polls of job
+        whose progress didn't change get `304 Not Modified`.
+
         Return:
             Response: dictionary with status (optionally, state and percent).
 
         """
         try:
-            job: models.ExportJob = self.export_job_model.objects.get(
-                id=job_id,
-            )
+            job: models.ExportJob = self.export_job_model.objects.only(
+                *self.export_job_progress_fields,
+            ).get(id=job_id)
         except self.export_job_model.DoesNotExist as error:
-            return JsonResponse(
+            response = JsonResponse(
                 dict(validation_error=error.args[0]),
                 status=http.HTTPStatus.NOT_FOUND,
             )
+            add_never_cache_headers(response)
+            return response
 
         response_data = dict(status=job.export_status.title())
 
         if job.export_status != models.ExportJob.ExportStatus.EXPORTING:
-            return JsonResponse(response_data)
+            return self._get_progress_response(request, job, response_data)
 
         percent = 0
         total = 0
@@ -125,7 +146,25 @@ class ExportJobAdmin(
             total=total,
             current=current,
         )
-        return JsonResponse(response_data)
+        return self._get_progress_response(request, job, response_data)
+
+    def _get_progress_response(
+        self,
+        request: WSGIRequest,
+        job: models.ExportJob,
+        response_data: dict[str, str | int],
+    ) -> HttpResponse:
+        """Return JSON response with job progress or `304 Not Modified`."""
+        state = ":".join(str(value) for value in response_data.values())
+        etag = f'W/"{job.id}:{state}"'
+        response = JsonResponse(response_data)
+        response.headers["ETag"] = etag
+        patch_cache_control(response, private=True, max_age=1)
+        return get_conditional_response(
+            request,
+            etag=etag,
+            response=response,
+        )
 
     def get_fieldsets(
         self,
@@ -103,14 +103,17 @@ class ImportJobAdmin(
         If current status is parsing/importing, view also returns job state
         and percent of completed work.
 
+        Job's pickled `result` is not loaded, because it isn't needed to get
+        progress and could be rather big.
+
         Return:
             Response: dictionary with status (optionally, state and percent).
 
         """
         try:
-            job: models.ImportJob = self.import_job_model.objects.get(
-                id=job_id,
-            )
+            job: models.ImportJob = self.import_job_model.objects.defer(
+                "result",
+            ).get(id=job_id)
         except self.import_job_model.DoesNotExist as error:
             return JsonResponse(
                 dict(validation_error=error.args[0]),
@@ -0,0 +1,62 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import migrations, models
+
+import tablib
+
+BATCH_SIZE = 500
+
+
+def convert_pickled_results(apps, schema_editor):
+    """Replace pickled export datasets with their JSON summary."""
+    ExportJob = apps.get_model("import_export_extensions", "ExportJob")  # noqa: N806
+    jobs = ExportJob.objects.only("id", "pickled_result")
+    updated_jobs = []
+    for job in jobs.iterator(chunk_size=BATCH_SIZE):
+        dataset = job.pickled_result
+        if not isinstance(dataset, tablib.Dataset):
+            continue
+        job.result = dict(
+            headers=list(dataset.headers or []),
+            total_rows=len(dataset),
+        )
+        updated_jobs.append(job)
+        if len(updated_jobs) >= BATCH_SIZE:
+            ExportJob.objects.bulk_update(updated_jobs, fields=["result"])
+            updated_jobs = []
+    ExportJob.objects.bulk_update(updated_jobs, fields=["result"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "import_export_extensions",
+            "0009_alter_exportjob_data_file_alter_importjob_data_file",
+        ),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name="exportjob",
+            old_name="result",
+            new_name="pickled_result",
+        ),
+        migrations.AddField(
+            model_name="exportjob",
+            name="result",
+            field=models.JSONField(
+                default=dict,
+                editable=False,
+                encoder=DjangoJSONEncoder,
+                help_text="Summary of exported data: headers and total rows count",
+                verbose_name="Job result",
+            ),
+        ),
+        migrations.RunPython(
+            code=convert_pickled_results,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.RemoveField(
+            model_name="exportjob",
+            name="pickled_result",
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("import_export_extensions", "0010_alter_exportjob_result"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="exportjob",
+            index=models.Index(
+                fields=["export_status", "id"],
+                name="iee_exportjob_status_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="exportjob",
+            index=models.Index(
+                fields=["created_by", "export_status"],
+                name="iee_exportjob_user_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="importjob",
+            index=models.Index(
+                fields=["import_status", "id"],
+                name="iee_importjob_status_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="importjob",
+            index=models.Index(
+                fields=["created_by", "import_status"],
+                name="iee_importjob_user_status_idx",
+            ),
+        ),
+    ]
@@ -5,9 +5,6 @@ from django.db import models
 from django.utils import module_loading
 from django.utils.translation import gettext_lazy as _
 
-from import_export.results import Result
-from picklefield.fields import PickledObjectField
-
 
 class CreationDateTimeField(models.DateTimeField):
     """DateTimeField to indicate created datetime.
@@ -108,14 +105,6 @@ class BaseJob(TimeStampedModel):
         verbose_name=_("Created by"),
         help_text=_("User which started job"),
     )
-    result = PickledObjectField(
-        default=Result,
-        verbose_name=_("Job result"),
-        help_text=_(
-            "Internal job result object that contain "
-            "info about job statistics. Pickled Python object",
-        ),
-    )
 
     class Meta:
         abstract = True
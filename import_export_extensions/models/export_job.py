@@ -1,17 +1,22 @@
+import csv
+import io
 import pathlib
+import tempfile
 import traceback
 import typing
 import uuid
 
 from django.core import files as django_files
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models, transaction
 from django.utils import encoding, module_loading, timezone
 from django.utils.translation import gettext_lazy as _
 
+import tablib
 from celery import current_app, result, states
 from import_export.formats import base_formats
 
-from .. import signals
+from .. import results, signals
 from . import tools
 from .core import BaseJob, TaskStateInfo
 
@@ -59,9 +64,11 @@ class ExportJob(BaseJob):
         EXPORTED = "EXPORTED", _("Exported")
         CANCELLED = "CANCELLED", _("Cancelled")
 
-    export_finished_statuses = (
-        ExportStatus.EXPORTED,
-        ExportStatus.EXPORT_ERROR,
+    export_finished_statuses: typing.ClassVar[frozenset[str]] = frozenset(
+        (
+            ExportStatus.EXPORTED,
+            ExportStatus.EXPORT_ERROR,
+        ),
     )
 
     export_status = models.CharField(
@@ -109,9 +116,29 @@ class ExportJob(BaseJob):
         null=True,
     )
 
+    result = models.JSONField(
+        default=dict,
+        encoder=DjangoJSONEncoder,
+        editable=False,
+        verbose_name=_("Job result"),
+        help_text=_(
+            "Summary of exported data: headers and total rows count",
+        ),
+    )
+
     class Meta:
         verbose_name = _("Export job")
         verbose_name_plural = _("Export jobs")
+        indexes = [
+            models.Index(
+                fields=["export_status", "id"],
+                name="iee_exportjob_status_id_idx",
+            ),
+            models.Index(
+                fields=["created_by", "export_status"],
+                name="iee_exportjob_user_status_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         """Return string representation."""
@@ -132,8 +159,14 @@ class ExportJob(BaseJob):
         Celery task is manually called with `apply_async`, to provide
         possibility of custom `task_id` with which task will be run.
 
+        Task is started only after transaction is committed, so worker
+        always finds created job in DB.
+
         """
         is_created = self._state.adding
+        if is_created:
+            # Set task id before insert to avoid extra update query
+            self.export_task_id = str(uuid.uuid4())
         super().save(
             force_insert=force_insert,
             force_update=force_update,
@@ -141,8 +174,6 @@ class ExportJob(BaseJob):
             update_fields=update_fields,
         )
         if is_created:
-            self.export_task_id = str(uuid.uuid4())
-            self.save(update_fields=["export_task_id"])
             transaction.on_commit(self._start_export_data_task)
 
     @property
@@ -157,6 +188,11 @@ class ExportJob(BaseJob):
             file_format=self.file_format,
         ).replace("/", "-")
 
+    @property
+    def export_result(self) -> results.ExportResult:
+        """Get `result` summary with attributes of exported dataset."""
+        return results.ExportResult(self.result)
+
     @property
     def progress(self) -> TaskStateInfo | None:
         """Return dict with export state."""
@@ -239,13 +275,22 @@ class ExportJob(BaseJob):
 
     def _export_data_inner(self) -> None:
         """Run export process with saving to file."""
-        self.result = self.resource.export()
+        resource = self.resource
+        if resource.stream_csv_export and isinstance(
+            self.file_format,
+            base_formats.CSV,
+        ):
+            self._export_data_to_csv_file(resource)
+            return
+
+        dataset = resource.export()
+        self.result = self._get_dataset_summary(dataset)
         self.save(update_fields=["result"])
 
         # `export_data` may be bytes (base formats such as xlsx, csv, etc.) or
         # file object (formats inherited from `BaseZipExport`)
         export_data = self.file_format.export_data(
-            dataset=self.result,
+            dataset=dataset,
             **self.resource.get_export_data_format_kwargs(
                 file_format=self.file_format,
             ),
@@ -261,6 +306,58 @@ class ExportJob(BaseJob):
             save=True,
         )
 
+    def _export_data_to_csv_file(self, resource) -> None:
+        """Write exported rows to CSV file one by one.
+
+        Rows are written to temporary file, which is then saved to
+        `data_file`, so memory usage doesn't depend on count of rows.
+
+        """
+        rows = resource.iter_export_rows()
+        headers = next(rows)
+        total_rows = 0
+        with tempfile.NamedTemporaryFile() as export_file:
+            text_file = io.TextIOWrapper(
+                export_file,
+                encoding="utf-8",
+                newline="",
+            )
+            writer = csv.writer(
+                text_file,
+                **resource.get_export_csv_writer_kwargs(),
+            )
+            writer.writerow(headers)
+            for row in rows:
+                writer.writerow(row)
+                total_rows += 1
+            text_file.flush()
+            export_file.seek(0)
+
+            self.result = dict(headers=list(headers), total_rows=total_rows)
+            self.save(update_fields=["result"])
+            self.data_file.save(
+                name=self.export_filename,
+                content=django_files.File(export_file),
+                save=True,
+            )
+            # Don't let wrapper close file, it's closed by context manager
+            text_file.detach()
+
+    @staticmethod
+    def _get_dataset_summary(
+        dataset: tablib.Dataset,
+    ) -> dict[str, typing.Any]:
+        """Get JSON serializable summary of exported dataset.
+
+        Exported dataset itself is not stored in DB, because it's already
+        saved to `data_file` and could be rather big.
+
+        """
+        return dict(
+            headers=list(dataset.headers or []),
+            total_rows=len(dataset),
+        )
+
     def _get_task_state(self, task_id: str) -> TaskStateInfo:
         """Get state info for passed task_id.
 
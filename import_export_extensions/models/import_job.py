@@ -13,6 +13,7 @@ import tablib
 from celery import current_app, result, states
 from import_export.formats import base_formats
 from import_export.results import Result
+from picklefield.fields import PickledObjectField
 
 from .. import signals
 from ..resources import CeleryResource
@@ -191,9 +192,28 @@ class ImportJob(BaseJob):
         verbose_name=_("Force import"),
     )
 
+    result = PickledObjectField(
+        default=Result,
+        verbose_name=_("Job result"),
+        help_text=_(
+            "Internal job result object that contain "
+            "info about job statistics. Pickled Python object",
+        ),
+    )
+
     class Meta:
         verbose_name = _("Import job")
         verbose_name_plural = _("Import jobs")
+        indexes = [
+            models.Index(
+                fields=["import_status", "id"],
+                name="iee_importjob_status_id_idx",
+            ),
+            models.Index(
+                fields=["created_by", "import_status"],
+                name="iee_importjob_user_status_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         """Return string representation."""
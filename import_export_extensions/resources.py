@@ -68,6 +68,17 @@ class CeleryResourceMixin:
             settings.STATUS_UPDATE_ROW_COUNT,
         )
 
+    @functools.cached_property
+    def stream_csv_export(self) -> bool:
+        """Whether to write CSV export to file row by row.
+
+        In this mode rows are written to file as they are exported without
+        building `tablib.Dataset`, so `_export` and `after_export` aren't
+        called.
+
+        """
+        return getattr(self._meta, "stream_csv_export", False)
+
     @classmethod
     def get_model_queryset(cls) -> QuerySet:
         """Return a queryset of all objects for this model.
@@ -341,6 +352,66 @@ class CeleryResourceMixin:
             **kwargs,
         )
 
+    def iter_queryset(
+        self,
+        queryset: QuerySet | collections.abc.Iterable[typing.Any],
+    ) -> collections.abc.Iterator[typing.Any]:
+        """Iterate over export queryset in chunks.
+
+        Parent class paginates querysets with `prefetch_related` by offset,
+        which makes every next page slower. If queryset is ordered only by
+        primary key (or not ordered at all), it's paginated by primary key
+        instead (keyset pagination), so each page costs the same.
+
+        """
+        if (
+            not isinstance(queryset, QuerySet)
+            or not queryset._prefetch_related_lookups
+            or queryset.query.order_by not in ((), ("pk",))
+            or queryset.query.is_sliced
+        ):
+            yield from super().iter_queryset(queryset)  # type: ignore
+            return
+
+        chunk_size = self.get_chunk_size()  # type: ignore
+        queryset = queryset.order_by("pk")
+        page = list(queryset[:chunk_size])
+        while page:
+            yield from page
+            if len(page) < chunk_size:
+                return
+            page = list(queryset.filter(pk__gt=page[-1].pk)[:chunk_size])
+
+    def iter_export_rows(
+        self,
+        queryset: QuerySet | None = None,
+        **kwargs,
+    ) -> collections.abc.Iterator[list[typing.Any]]:
+        """Yield headers and then exported rows one by one.
+
+        Same as `export`, but rows aren't collected to `tablib.Dataset`.
+        Headers are built from the same `export_fields` as rows, so they
+        always match row columns.
+
+        """
+        if queryset is None:
+            queryset = self.get_queryset()
+        queryset = self.filter_export(queryset, **kwargs)
+
+        self.initialize_task_state(
+            state=TaskState.EXPORTING.name,
+            queryset=queryset,
+        )
+        self.before_export(queryset, **kwargs)  # type: ignore
+        export_fields = kwargs.get("export_fields")
+        yield self.get_export_headers(selected_fields=export_fields)  # type: ignore
+        for obj in self.iter_queryset(queryset):
+            yield self.export_resource(
+                obj,
+                selected_fields=export_fields,
+                **kwargs,
+            )
+
     def export_resource(
         self,
         obj,
@@ -368,6 +439,15 @@ class CeleryResourceMixin:
         """Get additional params for export format."""
         return {}
 
+    def get_export_csv_writer_kwargs(self) -> dict[str, typing.Any]:
+        """Get params for `csv.writer` used by streaming CSV export.
+
+        Used instead of `get_export_data_format_kwargs`, because format
+        params are passed to `export_data` of format, not to `csv.writer`.
+
+        """
+        return {}
+
     def initialize_task_state(
         self,
         state: str,
@@ -98,6 +98,24 @@ class RowResult(results.RowResult):
         return self.import_type not in self.valid_import_types
 
 
+class ExportResult:
+    """Read-only adapter for summary stored in `ExportJob.result`.
+
+    `ExportJob.result` used to store exported `tablib.Dataset`, this class
+    provides its `headers`, `height` and `len()` for code relying on them.
+
+    """
+
+    def __init__(self, summary: dict[str, typing.Any]) -> None:
+        """Init adapter with summary of exported data."""
+        self.headers: list[str] = list(summary.get("headers", []))
+        self.height: int = summary.get("total_rows", 0)
+
+    def __len__(self) -> int:
+        """Return count of exported rows."""
+        return self.height
+
+
 class Result(results.Result):
     """Custom result class with ability to store info about skipped rows."""
 
@@ -1,8 +1,19 @@
 from django.conf import settings
+from django.core.files.storage import FileSystemStorage, InMemoryStorage
 
 import pytest
 
 
+def _get_job_file_fields():
+    """Get fields of job models which store files in package's storage."""
+    from import_export_extensions.models import ExportJob, ImportJob
+
+    return (
+        ExportJob._meta.get_field("data_file"),
+        ImportJob._meta.get_field("data_file"),
+    )
+
+
 def pytest_configure() -> None:
     """Set up Django settings for tests.
 
@@ -41,3 +52,27 @@ def _temp_directory_for_media(tmpdir_factory):
         )
     media = tmpdir_factory.mktemp("tmp_media")
     settings.MEDIA_ROOT = media
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _in_memory_job_storage(_temp_directory_for_media):
+    """Keep import/export job files in memory.
+
+    Most of tests only check that job file exists, so avoid writing it to
+    disk. Storage of job file fields is set on model import, that's why it's
+    replaced on fields directly.
+
+    """
+    for field in _get_job_file_fields():
+        field.storage = InMemoryStorage()
+
+
+@pytest.fixture
+def real_media_storage(monkeypatch: pytest.MonkeyPatch):
+    """Store import/export job files in temp media directory.
+
+    Use it in tests which read job files from disk.
+
+    """
+    for field in _get_job_file_fields():
+        monkeypatch.setattr(field, "storage", FileSystemStorage())
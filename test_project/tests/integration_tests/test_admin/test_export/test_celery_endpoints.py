@@ -75,3 +75,39 @@ def test_celery_export_results_view_redirect_to_status_page(
     )
     assert response.status_code == status.HTTP_302_FOUND
     assert response.url == expected_redirect_url
+
+
+@pytest.mark.parametrize(
+    argnames="finished_job_status",
+    argvalues=[
+        ExportJob.ExportStatus.EXPORTED,
+        ExportJob.ExportStatus.EXPORT_ERROR,
+    ],
+)
+def test_celery_export_status_view_redirect_to_results_page(
+    client: Client,
+    superuser: User,
+    finished_job_status: ExportJob.ExportStatus,
+    mocker: pytest_mock.MockerFixture,
+):
+    """Test redirect to export results page when job is finished."""
+    client.force_login(superuser)
+
+    mocker.patch("import_export_extensions.tasks.export_data_task.apply_async")
+    artist_export_job = ArtistExportJobFactory()
+    artist_export_job.export_status = finished_job_status
+    artist_export_job.save()
+
+    response = client.get(
+        path=reverse(
+            "admin:fake_app_artist_export_job_status",
+            kwargs={"job_id": artist_export_job.pk},
+        ),
+    )
+
+    expected_redirect_url = reverse(
+        "admin:fake_app_artist_export_job_results",
+        kwargs={"job_id": artist_export_job.pk},
+    )
+    assert response.status_code == status.HTTP_302_FOUND
+    assert response.url == expected_redirect_url
@@ -2,7 +2,9 @@ import csv
 import pathlib
 import uuid
 
+from django.contrib import admin
 from django.contrib.auth.models import User
+from django.test import RequestFactory
 from django.test.client import Client
 from django.urls import reverse
 
@@ -18,7 +20,7 @@ from test_project.fake_app.factories import (
     ArtistExportJobFactory,
     ArtistFactory,
 )
-from test_project.fake_app.models import Instrument
+from test_project.fake_app.models import Artist, Instrument
 
 
 @pytest.mark.usefixtures("existing_artist")
@@ -104,6 +106,52 @@ def test_export_using_admin_model_without_permissions(
     assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+def test_export_permission_cached_per_request(
+    rf: RequestFactory,
+    superuser: User,
+    mocker: pytest_mock.MockerFixture,
+):
+    """Test that export permission is checked only once per request."""
+    check_permission = mocker.patch(
+        "import_export.admin.ExportMixin.has_export_permission",
+        return_value=True,
+    )
+    model_admin = admin.site._registry[Artist]
+    request = rf.get("/")
+    request.user = superuser
+
+    assert model_admin.has_export_permission(request)
+    assert model_admin.has_export_permission(request)
+    check_permission.assert_called_once()
+
+    # Permission is checked again for new request
+    another_request = rf.get("/")
+    another_request.user = superuser
+    assert model_admin.has_export_permission(another_request)
+    assert check_permission.call_count == 2
+
+
+def test_export_status_view_loads_only_required_fields(
+    client: Client,
+    superuser: User,
+    mocker: pytest_mock.MockerFixture,
+):
+    """Test that status view doesn't load heavy fields of export job."""
+    client.force_login(superuser)
+    mocker.patch("import_export_extensions.models.ExportJob.export_data")
+    artist_export_job = ArtistExportJobFactory()
+
+    response = client.get(
+        path=reverse(
+            "admin:fake_app_artist_export_job_status",
+            kwargs={"job_id": artist_export_job.pk},
+        ),
+    )
+    assert response.status_code == status.HTTP_200_OK
+    deferred_fields = response.context["export_job"].get_deferred_fields()
+    assert {"result", "traceback", "resource_kwargs"} <= deferred_fields
+
+
 @pytest.mark.django_db(transaction=True)
 def test_export_progress_during_export(
     client: Client,
@@ -170,6 +218,35 @@ def test_export_progress_after_complete_export(
     }
 
 
+def test_export_progress_not_modified(
+    client: Client,
+    superuser: User,
+):
+    """Test that progress with unchanged state is not sent again."""
+    client.force_login(superuser)
+
+    artist_export_job = ArtistExportJobFactory()
+    progress_url = reverse(
+        "admin:export_job_progress",
+        kwargs={"job_id": artist_export_job.pk},
+    )
+
+    response = client.get(path=progress_url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Cache-Control"] == "private, max-age=1"
+    etag = response.headers["ETag"]
+
+    response = client.get(path=progress_url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["Cache-Control"] == "private, max-age=1"
+
+    artist_export_job.export_status = ExportJob.ExportStatus.CANCELLED
+    artist_export_job.save()
+    response = client.get(path=progress_url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+
+
 @pytest.mark.django_db(transaction=True)
 def test_export_progress_with_deleted_export_job(
     client: Client,
@@ -238,6 +315,7 @@ def test_export_progress_with_failed_celery_task(
     )
 
 
+@pytest.mark.usefixtures("real_media_storage")
 @pytest.mark.django_db(transaction=True)
 def test_export_using_get_params(
     client: Client,
@@ -10,7 +10,6 @@ import pytest
 from import_export_extensions.models import ExportJob
 
 
-@pytest.mark.django_db(transaction=True)
 @pytest.mark.parametrize(
     argnames="export_url",
     argvalues=[
@@ -164,7 +163,6 @@ def test_export_api_ordering(
     )
 
 
-@pytest.mark.django_db(transaction=True)
 @pytest.mark.parametrize(
     argnames="export_url",
     argvalues=[
@@ -193,7 +191,6 @@ def test_export_api_create_export_job_with_invalid_filter_kwargs(
     assert str(response.data["id"][0]) == "Enter a number."
 
 
-@pytest.mark.django_db(transaction=True)
 @pytest.mark.parametrize(
     argnames="export_url",
     argvalues=[
@@ -255,7 +252,6 @@ def test_export_api_detail(
     assert response.data["export_finished"]
 
 
-@pytest.mark.django_db(transaction=True)
 @pytest.mark.parametrize(
     argnames="export_url",
     argvalues=[
@@ -295,7 +291,6 @@ def test_import_user_api_get_detail(
     assert response.status_code == status.HTTP_404_NOT_FOUND, response.data
 
 
-@pytest.mark.django_db(transaction=True)
 @pytest.mark.parametrize(
     argnames="allowed_cancel_status",
     argvalues=[
@@ -336,7 +331,6 @@ def test_export_api_cancel(
     assert not response.data["export_finished"]
 
 
-@pytest.mark.django_db(transaction=True)
 @pytest.mark.parametrize(
     argnames="incorrect_job_status",
     argvalues=[
@@ -1,8 +1,13 @@
+import csv
+import pathlib
+
+import pytest
 from pytest_mock import MockerFixture
 
 from import_export_extensions.models import ExportJob
 
-from ..fake_app.factories import ArtistExportJobFactory
+from ..fake_app.factories import ArtistExportJobFactory, ArtistFactory
+from ..fake_app.resources import SimpleArtistResource
 
 
 def test_export_data_exported(artist_export_job: ExportJob):
@@ -15,6 +20,73 @@ def test_export_data_exported(artist_export_job: ExportJob):
     # ensure file exists
     assert artist_export_job.data_file
 
+    # ensure only summary of exported data is stored
+    assert artist_export_job.result["total_rows"] == 0
+    assert artist_export_job.result["headers"]
+    assert len(artist_export_job.export_result) == 0
+    assert (
+        artist_export_job.export_result.headers
+        == artist_export_job.result["headers"]
+    )
+
+
+@pytest.mark.usefixtures("real_media_storage")
+def test_export_data_streamed_to_csv_file(
+    artist_export_job: ExportJob,
+    mocker: MockerFixture,
+):
+    """Test that csv file is written row by row without dataset."""
+    artists = ArtistFactory.create_batch(3)
+    mocker.patch.object(
+        SimpleArtistResource._meta,
+        "stream_csv_export",
+        True,
+        create=True,
+    )
+    dataset_export = mocker.patch.object(SimpleArtistResource, "export")
+
+    artist_export_job.export_data()
+
+    assert artist_export_job.export_status == ExportJob.ExportStatus.EXPORTED
+    dataset_export.assert_not_called()
+    assert artist_export_job.result["total_rows"] == len(artists)
+    with pathlib.Path(artist_export_job.data_file.path).open() as file:
+        content = list(csv.reader(file))
+    assert content[0] == artist_export_job.result["headers"]
+    assert len(content) == len(artists) + 1
+
+
+@pytest.mark.usefixtures("real_media_storage")
+def test_export_data_streamed_to_csv_file_with_writer_kwargs(
+    artist_export_job: ExportJob,
+    mocker: MockerFixture,
+):
+    """Test that streaming export passes only csv writer params to writer."""
+    ArtistFactory.create_batch(2)
+    mocker.patch.object(
+        SimpleArtistResource._meta,
+        "stream_csv_export",
+        True,
+        create=True,
+    )
+    mocker.patch.object(
+        SimpleArtistResource,
+        "get_export_data_format_kwargs",
+        return_value={"escape_formulae": True},
+    )
+    mocker.patch.object(
+        SimpleArtistResource,
+        "get_export_csv_writer_kwargs",
+        return_value={"delimiter": ";"},
+    )
+
+    artist_export_job.export_data()
+
+    assert artist_export_job.export_status == ExportJob.ExportStatus.EXPORTED
+    with pathlib.Path(artist_export_job.data_file.path).open() as file:
+        content = list(csv.reader(file, delimiter=";"))
+    assert content[0] == artist_export_job.result["headers"]
+
 
 def test_export_data_error(
     artist_export_job: ExportJob,
@@ -0,0 +1,52 @@
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+import pytest
+import tablib
+from import_export.results import Result
+
+APP_LABEL = "import_export_extensions"
+MIGRATE_FROM = (
+    APP_LABEL,
+    "0009_alter_exportjob_data_file_alter_importjob_data_file",
+)
+MIGRATE_TO = (APP_LABEL, "0010_alter_exportjob_result")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_job_result_converted_to_summary():
+    """Test that pickled export datasets are replaced with their summary."""
+    executor = MigrationExecutor(connection)
+    latest_migrations = executor.loader.graph.leaf_nodes(APP_LABEL)
+    executor.migrate([MIGRATE_FROM])
+    old_apps = executor.loader.project_state([MIGRATE_FROM]).apps
+    OldExportJob = old_apps.get_model(APP_LABEL, "ExportJob")  # noqa: N806
+
+    dataset = tablib.Dataset(("1", "Artist"), headers=["id", "name"])
+    job_with_dataset = OldExportJob.objects.create(
+        resource_path="resource_path",
+        file_format_path="file_format_path",
+        result=dataset,
+    )
+    job_with_default = OldExportJob.objects.create(
+        resource_path="resource_path",
+        file_format_path="file_format_path",
+        result=Result(),
+    )
+
+    try:
+        executor.loader.build_graph()
+        executor.migrate([MIGRATE_TO])
+        new_apps = executor.loader.project_state([MIGRATE_TO]).apps
+        NewExportJob = new_apps.get_model(APP_LABEL, "ExportJob")  # noqa: N806
+
+        job_with_dataset = NewExportJob.objects.get(id=job_with_dataset.id)
+        assert job_with_dataset.result == dict(
+            headers=["id", "name"],
+            total_rows=1,
+        )
+        job_with_default = NewExportJob.objects.get(id=job_with_default.id)
+        assert job_with_default.result == {}
+    finally:
+        executor.loader.build_graph()
+        executor.migrate(latest_migrations)
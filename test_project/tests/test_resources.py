@@ -1,16 +1,19 @@
 import re
 
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework.exceptions import ValidationError
 
 import pytest
+import pytest_mock
 
 from import_export_extensions import results
 from test_project.fake_app.factories import ArtistFactory
 from test_project.fake_app.models import Artist
 
-from ..fake_app.resources import SimpleArtistResource
+from ..fake_app.resources import ArtistResourceWithM2M, SimpleArtistResource
 
 
 def test_resource_get_queryset(existing_artist: Artist):
@@ -53,6 +56,53 @@ def test_resource_with_ordering():
     assert resource_queryset.first() == artists[-1]
 
 
+def test_resource_iter_queryset_by_pk(mocker: pytest_mock.MockerFixture):
+    """Check that prefetched queryset is iterated in pages by primary key."""
+    artists = ArtistFactory.create_batch(5)
+    resource = ArtistResourceWithM2M()
+    mocker.patch.object(resource, "get_chunk_size", return_value=2)
+
+    with CaptureQueriesContext(connection) as context:
+        assert list(
+            resource.iter_queryset(resource.get_queryset()),
+        ) == artists
+
+    artist_table = Artist._meta.db_table
+    page_queries = [
+        query["sql"]
+        for query in context.captured_queries
+        if f'FROM "{artist_table}"' in query["sql"]
+    ]
+    assert len(page_queries) == 3
+    assert not any("OFFSET" in query for query in page_queries)
+    assert all(
+        f'"{artist_table}"."id" >' in query for query in page_queries[1:]
+    )
+
+
+def test_resource_iter_sliced_queryset(mocker: pytest_mock.MockerFixture):
+    """Check that sliced prefetched queryset is iterated by parent class."""
+    artists = ArtistFactory.create_batch(5)
+    resource = ArtistResourceWithM2M()
+    mocker.patch.object(resource, "get_chunk_size", return_value=2)
+    queryset = resource.get_queryset().order_by("pk")[:3]
+
+    assert list(resource.iter_queryset(queryset)) == artists[:3]
+
+
+def test_resource_iter_export_rows_with_export_fields(
+    existing_artist: Artist,
+):
+    """Check that exported headers and rows contain only export fields."""
+    resource = SimpleArtistResource()
+    export_field = resource.get_export_fields()[0]
+
+    headers, *rows = resource.iter_export_rows(export_fields=[export_field])
+
+    assert headers == [export_field.column_name]
+    assert rows == [[export_field.export(existing_artist)]]
+
+
 def test_resource_with_invalid_ordering():
     """Check that `get_queryset` raise error if ordering is invalid."""
     with pytest.raises(